@@ -13,9 +13,14 @@ The Graph, Vertex, and Edge included in this file were made to meet the needs
 of the algorithm.
 """
 
+from array import array
+from collections import deque
+
 class Vertex:
     """A minimal vertex with just an ID."""
     
+    __slots__ = ('id',)
+    
     def __init__(self, vertex_id):
         self.id = vertex_id
     
@@ -25,6 +30,8 @@ class Vertex:
 class Edge:
     """A simple weighted directed edge."""
     
+    __slots__ = ('source', 'dest', 'weight')
+    
     def __init__(self, source, dest, weight):
         self.source = source
         self.dest = dest
@@ -37,6 +44,8 @@ class Edge:
 class Graph:
     """A graph class containging a map of vertices and a list of edges."""
     
+    __slots__ = ('vertices', 'edges')
+    
     def __init__(self):
         """Creates an empty graph."""
         self.vertices = {}
@@ -75,6 +84,20 @@ def bellman_ford(g, start_id):
     vertex. At each step the distance of each vertex is either correct or an
     overestimate of the actual minimum distance.
     
+    The edges are relaxed in an order due to Yen. Edges that lead from a
+    lower id to a higher id are relaxed first, in ascending order of their
+    source, then the remaining edges are relaxed in descending order of
+    their source. Within one pass, a distance improvement at a vertex can
+    then propagate through a whole ascending chain of ids and a whole
+    descending chain of ids, rather than through a single edge, which
+    roughly halves the number of passes needed to converge.
+    
+    Passes after the first also skip every edge whose source vertex's
+    distance has not changed since the edge was last considered; such an
+    edge would only recompute the same candidate distance that already
+    failed to relax. Only the edges leaving recently-improved vertices,
+    which form a frontier spreading out from the start, do any work.
+    
     Negative edge-weight cycles would cause this algorithm to produce an
     incorrect result. The most that this algorithm can offer is to produce an
     error when a negative edge cycle is found. This implementation can not
@@ -82,32 +105,168 @@ def bellman_ford(g, start_id):
     is not a meaningful comparison that can be made between two infinities.
     
     :param g: The graph all vertices and edges are in.
-    :param start_id: The id of the starting vertex.
-    :return: Two dictionaries, one containing distances from start and one
-        containing the neighbour on the path back to start.
+    :param start_id: The id of the starting vertex. Vertex ids must be
+        the dense integers 0..n-1.
+    :return: Two lists indexed by vertex id, one containing distances from
+        start and one containing the neighbour on the path back to start.
     """
+    n = len(g.vertices)
+    
+    # Partition the edges for Yen's ordering: edges toward higher ids
+    # sorted by ascending source, then edges toward lower or equal ids
+    # sorted by descending source.
+    forward_edges = []
+    backward_edges = []
+    for e in g.edges:
+        if e.source.id < e.dest.id:
+            forward_edges.append((e.source.id, e.dest.id, e.weight))
+        else:
+            backward_edges.append((e.source.id, e.dest.id, e.weight))
+    forward_edges.sort()
+    backward_edges.sort(reverse=True)
+    
+    # A structure-of-arrays copy of the reordered edge list. Each edge's
+    # source id, destination id, and weight land in flat typed arrays, so
+    # a relaxation pass scans three compact arrays instead of following an
+    # object reference and three attribute lookups per edge.
+    srcs = array('i')
+    dsts = array('i')
+    weights = array('d')
+    for edge_tuple in forward_edges + backward_edges:
+        srcs.append(edge_tuple[0])
+        dsts.append(edge_tuple[1])
+        weights.append(edge_tuple[2])
+    m = len(srcs)
+    
     # Initial distances are at positive infinity.
-    dists = { key: float('Infinity') for key in g.vertices }
+    dists = [float('Infinity')] * n
     # Initial previous vertices are all an invalid vertex.
-    prevs = { key: None for key in g.vertices }
+    prevs = [None] * n
     
     # Corrects the distance to the starting vertex to 0.
     dists[start_id] = 0
     
+    # A byte per vertex flagging whether its distance changed in the
+    # previous pass, and another for the pass underway. An edge can only
+    # relax if its source's distance has changed since the edge was last
+    # looked at, so edges leaving unflagged vertices are skipped without
+    # recomputing the candidate distance. At the start only the starting
+    # vertex has changed.
+    changed_prev = bytearray(n)
+    changed_curr = bytearray(n)
+    changed_prev[start_id] = 1
+    
     # Relax the edges once for each vertex in the graph except the start.
-    for i in range(1, len(g.vertices)):
-        for e in g.edges:
-            dist_start_dest = dists[e.source.id] + e.weight
-            if dists[e.dest.id] > dist_start_dest:
-                dists[e.dest.id] = dist_start_dest
-                prevs[e.dest.id] = e.source.id
-                    
+    for i in range(1, n):
+        any_changed = False
+        for k in range(m):
+            s = srcs[k]
+            # Checking the current pass's flags as well keeps the in-pass
+            # chain propagation that Yen's ordering provides.
+            if not (changed_prev[s] or changed_curr[s]):
+                continue
+            dist_start_dest = dists[s] + weights[k]
+            if dists[dsts[k]] > dist_start_dest:
+                dists[dsts[k]] = dist_start_dest
+                prevs[dsts[k]] = s
+                changed_curr[dsts[k]] = 1
+                any_changed = True
+        # If a full pass relaxed nothing, the distances have converged
+        # and the remaining passes would be no-ops.
+        if not any_changed:
+            break
+        changed_prev = changed_curr
+        changed_curr = bytearray(n)
+    
     # Check for negative weight cycles.
     # A cycle can be identified if a vertex is further away from
     # one of its neighbours than the length of the edge connecting them.
+    for k in range(m):
+        if dists[srcs[k]] + weights[k] < dists[dsts[k]]:
+            raise NegativeEdgeCycleError(srcs[k], dsts[k])
+    
+    return dists, prevs
+
+def bellman_ford_spfa(g, start_id):
+    """A queue-driven variant of the Bellman-Ford algorithm.
+    
+    The plain Bellman-Ford algorithm relaxes every edge in the graph
+    once per pass, even the edges whose source vertex is still at
+    infinity or has not changed since the last pass. This variant,
+    often called the Shortest Path Faster Algorithm, only relaxes the
+    outgoing edges of vertices whose own distance recently improved.
+    
+    A queue holds the vertices with improved distances. Each iteration
+    takes one vertex from the queue and relaxes its outgoing edges; any
+    destination whose distance improves is added to the queue if it is
+    not already waiting in it. The distances have converged when the
+    queue is empty. The worst case matches plain Bellman-Ford, but on
+    most graphs far fewer relaxations are performed.
+    
+    On a graph with a negative edge-weight cycle the queue never
+    drains. A vertex can only be taken from the queue more than n times
+    if it is being relaxed around a cycle, so this raises
+    NegativeEdgeCycleError at that point. Like bellman_ford, cycles
+    that are not reachable from the starting vertex are not found.
+    
+    :param g: The graph all vertices and edges are in.
+    :param start_id: The id of the starting vertex. Vertex ids must be
+        the dense integers 0..n-1.
+    :return: Two lists indexed by vertex id, one containing distances from
+        start and one containing the neighbour on the path back to start.
+    """
+    n = len(g.vertices)
+    m = len(g.edges)
+    
+    # Counting sort of the edges by source id into CSR arrays, so that
+    # the outgoing edges of a vertex are one contiguous slice.
+    indptr = array('i', [0] * (n + 1))
+    for e in g.edges:
+        indptr[e.source.id + 1] += 1
+    for u in range(n):
+        indptr[u + 1] += indptr[u]
+    dsts = array('i', [0] * m)
+    weights = array('d', [0.0] * m)
+    slots = list(indptr[:n])
     for e in g.edges:
-        if dists[e.source.id] + e.weight < dists[e.dest.id]:
-            raise NegativeEdgeCycleError(e.source.id, e.dest.id)
+        k = slots[e.source.id]
+        dsts[k] = e.dest.id
+        weights[k] = e.weight
+        slots[e.source.id] += 1
+    
+    # Initial distances are at positive infinity.
+    dists = [float('Infinity')] * n
+    # Initial previous vertices are all an invalid vertex.
+    prevs = [None] * n
+    
+    # Corrects the distance to the starting vertex to 0.
+    dists[start_id] = 0
+    
+    # The queue of vertices with improved distances, a byte per vertex
+    # flagging queue membership, and a count of queue removals per
+    # vertex for cycle detection.
+    visit_queue = deque([start_id])
+    in_queue = bytearray(n)
+    in_queue[start_id] = 1
+    removals = [0] * n
+    
+    while visit_queue:
+        u = visit_queue.popleft()
+        in_queue[u] = 0
+        
+        removals[u] += 1
+        if removals[u] > n:
+            raise NegativeEdgeCycleError(prevs[u], u)
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = dsts[k]
+            dist_start_dest = dists[u] + weights[k]
+            if dists[v] > dist_start_dest:
+                dists[v] = dist_start_dest
+                prevs[v] = u
+                if not in_queue[v]:
+                    visit_queue.append(v)
+                    in_queue[v] = 1
     
     return dists, prevs
 
@@ -136,7 +295,7 @@ if __name__ == '__main__':
     try:
         dists, prevs = bellman_ford(g, start)
         print("Distances and Previous Vertices:")
-        for d in dists:
+        for d in range(num_nodes):
             print("Vertex {0} - Previous: {2}, Distance: {1}".format(
             d, dists[d], prevs[d]))
     except NegativeEdgeCycleError as e:
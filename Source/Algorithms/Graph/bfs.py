@@ -11,11 +11,15 @@ The Graph, Node, and Edge included in this file were made to meet the needs
 of the algorithm.
 """
 
-from queue import Queue
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 class Vertex:
     """A minimal vertex with just an ID."""
     
+    __slots__ = ('id', 'edges')
+    
     def __init__(self, vertex_id):
         self.id = vertex_id
         self.edges = []
@@ -27,6 +31,8 @@ class Vertex:
 class Edge:
     """A simple directed edge."""
     
+    __slots__ = ('source', 'dest')
+    
     def __init__(self, source, dest):
         self.source = source
         self.dest = dest
@@ -38,6 +44,8 @@ class Edge:
 class Graph:
     """A graph class containging a map from vertex ids to vertices."""
     
+    __slots__ = ('vertices',)
+    
     def __init__(self):
         """Creates an empty graph."""
         self.vertices = {}
@@ -46,12 +54,40 @@ class Graph:
         return 'Vertices:\n\t{0}'.format(
             '\n\t'.join(str(v) for v in self.vertices.values()))
 
+def build_csr(g):
+    """Builds a Compressed Sparse Row view of a graph's adjacency.
+    
+    The CSR form packs every adjacency list into one flat, typed array
+    of destination ids, with a second array of offsets marking where
+    each vertex's neighbours start. The neighbours of vertex u are the
+    contiguous slice indices[indptr[u]:indptr[u+1]], so a traversal
+    touches one compact run of integers per vertex instead of one
+    Python object per edge.
+    
+    :param g: The graph to compress. Vertex ids must be the dense
+        integers 0..n-1.
+    :return: A tuple (indptr, indices) of typed integer arrays.
+    """
+    indptr = array('i', [0])
+    indices = array('i')
+    
+    for u in range(len(g.vertices)):
+        for e in g.vertices[u].edges:
+            indices.append(e.dest.id)
+        indptr.append(len(indices))
+    
+    return indptr, indices
+
 def bfs(g, start_id):
     """An iterative Breadth-First Search implementation.
     
-    This implementation maintains a queue of vertices to visit
-    and a set of vertices which have already been added to the
-    visit queue.
+    This implementation maintains a queue of vertex ids to visit
+    and an array of flags marking vertices which have already been
+    added to the visit queue.
+    
+    The graph's adjacency is first compressed into CSR arrays, so the
+    traversal loop reads neighbour ids out of a flat array slice rather
+    than following Edge and Vertex object references.
     
     BFS by itself doesn't have any side effects, but the algorithm
     can be adapted to do something while visiting a vertex.
@@ -59,16 +95,91 @@ def bfs(g, start_id):
     :param g: The graph containing the start vertex.
     :param start_id: The id of the vertex to start from.
     """
-    visit_queue = Queue()
-    vertices_seen = set()
+    indptr, indices = build_csr(g)
+    visited = bytearray(len(g.vertices))
     
-    visit_queue.put(g.vertices[start_id])
-    vertices_seen.add(start_id)
+    # A deque appends and pops from either end in constant time, without
+    # the locking that the thread-safe queue.Queue does on every
+    # operation; this search is single-threaded.
+    visit_queue = deque()
+    visit_queue.append(start_id)
+    visited[start_id] = 1
     
-    while not visit_queue.empty():
-        v = visit_queue.get()
+    while visit_queue:
+        u = visit_queue.popleft()
         
-        for e in v.edges:
-            if e.dest.id not in vertices_seen:
-                visit_queue.put(e.dest)
-                vertices_seen.add(e.dest.id)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if not visited[v]:
+                visit_queue.append(v)
+                visited[v] = 1
+
+def _expand_chunk(chunk, indptr, indices, visited):
+    """Collects the not-yet-visited neighbours of one chunk of a frontier.
+    
+    The visited flags are only read here, never written; marking vertices
+    as visited is left to the caller so that chunks can be expanded
+    concurrently without coordinating writes.
+    
+    :param chunk: The portion of the frontier to expand.
+    :param indptr: The CSR offset array of the graph.
+    :param indices: The CSR neighbour array of the graph.
+    :param visited: The array of flags for previously visited vertices.
+    :return: A list of candidate vertex ids for the next frontier,
+        possibly containing duplicates.
+    """
+    candidates = []
+    for u in chunk:
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if not visited[v]:
+                candidates.append(v)
+    return candidates
+
+def bfs_parallel(g, start_id, num_workers=4):
+    """A level-synchronous Breadth-First Search implementation.
+    
+    Where bfs above visits one vertex at a time from a queue, this
+    variant works frontier by frontier: all vertices at distance d from
+    the start form one frontier, and their collective unvisited
+    neighbours form the frontier at distance d+1. The vertices within a
+    frontier can be expanded in any order without changing the result,
+    so each frontier is split into chunks that a pool of worker threads
+    expands simultaneously. The candidate lists the workers return are
+    then merged and deduplicated on the main thread before the next
+    level begins, so the visited flags have a single writer.
+    
+    On large graphs the frontier expansion is the bulk of the work and
+    each chunk is independent, which is what makes BFS a naturally
+    parallel algorithm. Note that CPython's global interpreter lock
+    only lets one thread run Python bytecode at a time, so for this
+    pure-Python loop the speedup on one machine is limited; the
+    structure is the point of the example.
+    
+    :param g: The graph containing the start vertex.
+    :param start_id: The id of the vertex to start from.
+    :param num_workers: The number of worker threads to expand with.
+    """
+    indptr, indices = build_csr(g)
+    visited = bytearray(len(g.vertices))
+    
+    visited[start_id] = 1
+    frontier = [start_id]
+    
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        while frontier:
+            # Split the frontier into one chunk per worker.
+            chunk_size = -(-len(frontier) // num_workers)
+            chunks = [frontier[i:i + chunk_size]
+                for i in range(0, len(frontier), chunk_size)]
+            
+            # Expand the chunks in parallel, then merge their candidate
+            # lists, keeping each newly seen vertex once.
+            next_frontier = []
+            for candidates in pool.map(
+                    lambda c: _expand_chunk(c, indptr, indices, visited),
+                    chunks):
+                for v in candidates:
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+            
+            frontier = next_frontier
@@ -2,7 +2,7 @@
 Fundamentals :: Algorithms :: Depth-First Search
 Author: Quinn Mortimer.
 
-This is a simple recursive Depth-First Search implementation.
+This is a simple iterative Depth-First Search implementation.
 It is inteded as a reference for those looking to brush up on important
 algorithms.
 """
@@ -11,9 +11,13 @@ The Graph, Node, and Edge included in this file were made to meet the needs
 of the algorithm.
 """
 
+from array import array
+
 class Vertex:
     """A minimal vertex with just an ID."""
     
+    __slots__ = ('id', 'edges')
+    
     def __init__(self, vertex_id):
         self.id = vertex_id
         self.edges = []
@@ -25,6 +29,8 @@ class Vertex:
 class Edge:
     """A simple directed edge."""
     
+    __slots__ = ('source', 'dest')
+    
     def __init__(self, source, dest):
         self.source = source
         self.dest = dest
@@ -36,6 +42,8 @@ class Edge:
 class Graph:
     """A graph class containging a map from vertex ids to vertices."""
     
+    __slots__ = ('vertices',)
+    
     def __init__(self):
         """Creates an empty graph."""
         self.vertices = {}
@@ -44,35 +52,72 @@ class Graph:
         return 'Vertices:\n\t{0}'.format(
             '\n\t'.join(str(v) for v in self.vertices.values()))
 
-def dfs(g, start_id):
-    """A recursive Depth-First Search implementation.
+def build_csr(g):
+    """Builds a Compressed Sparse Row view of a graph's adjacency.
     
-    This function has two responsibilites, created a set to store the
-    visited vertex ids and call the DFS driver function on the starting
-    vertex.
+    The CSR form packs every adjacency list into one flat, typed array
+    of destination ids, with a second array of offsets marking where
+    each vertex's neighbours start. The neighbours of vertex u are the
+    contiguous slice indices[indptr[u]:indptr[u+1]], so a traversal
+    touches one compact run of integers per vertex instead of one
+    Python object per edge.
     
-    :param g: The graph containing the start vertex.
-    :param start_id: The id of the vertex to start from.
+    :param g: The graph to compress. Vertex ids must be the dense
+        integers 0..n-1.
+    :return: A tuple (indptr, indices) of typed integer arrays.
     """
-    visited = set()
-    _dfs_visit(g.vertices[start_id], visited)
+    indptr = array('i', [0])
+    indices = array('i')
+    
+    for u in range(len(g.vertices)):
+        for e in g.vertices[u].edges:
+            indices.append(e.dest.id)
+        indptr.append(len(indices))
+    
+    return indptr, indices
 
-def _dfs_visit(v, visited):
-    """Visits a node, then recursively visits its neighbours.
+def dfs(g, start_id):
+    """An iterative Depth-First Search implementation.
+    
+    This visits vertices in the same order as the classic recursive
+    formulation, but keeps an explicit stack of (vertex id, next
+    neighbour offset) pairs instead of recursing. Each iteration looks
+    at the frame on top of the stack: if that vertex still has
+    neighbours left in its CSR slice, the offset is advanced and an
+    unvisited neighbour is pushed as a new frame; otherwise the frame
+    is popped. A frame's offset plays the role that the position in the
+    edge loop plays in the recursive version.
     
-    Once the node has been visited, this function loops through all edges
-    going out from the current node. For each edge, if the destination has
-    not been visited, then this calls itself on that vertex.
+    Recursing once per traversed edge allocates a Python stack frame
+    each time and runs into the interpreter's recursion limit on deep
+    graphs; the explicit stack avoids both.
     
     DFS by itself doesn't have any specific side effects, but the algorithm
     can be adapted to take any action when visiting a vertex, before or
     after visiting the vertex's neighbours.
     
-    :param v: The vertex to visit.
-    :param visited: The set of previously visited vertices.
+    :param g: The graph containing the start vertex.
+    :param start_id: The id of the vertex to start from.
     """
-    visited.add(v.id)
+    indptr, indices = build_csr(g)
+    visited = bytearray(len(g.vertices))
+    
+    visited[start_id] = 1
+    stack = [(start_id, indptr[start_id])]
     
-    for e in v.edges:
-        if e.dest.id not in visited:
-            _dfs_visit(e.dest, visited)
+    while stack:
+        u, k = stack[-1]
+        
+        # All of this vertex's neighbours have been considered, so the
+        # visit to it is complete.
+        if k == indptr[u + 1]:
+            stack.pop()
+            continue
+        
+        # Record that the neighbour at offset k has been considered.
+        stack[-1] = (u, k + 1)
+        
+        v = indices[k]
+        if not visited[v]:
+            visited[v] = 1
+            stack.append((v, indptr[v]))
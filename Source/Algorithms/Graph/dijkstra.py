@@ -11,11 +11,15 @@ The Graph, Node, and Edge included in this file were made to meet the needs
 of the algorithm.
 """
 
-from queue import PriorityQueue
+import heapq
+
+from array import array
 
 class Node:
     """A simple node with an id and list of edges."""
     
+    __slots__ = ('id', 'edges')
+    
     def __init__(self, node_id):
         """Creates a node with a known ID and an empty edge list."""
         self.id = node_id
@@ -33,6 +37,8 @@ class Node:
 class Edge:
     """A simple weighted directed edge from one node to another."""
     
+    __slots__ = ('source', 'dest', 'weight')
+    
     def __init__(self, source, dest, weight):
         self.source = source
         self.dest = dest
@@ -45,6 +51,8 @@ class Edge:
 class Graph:
     """A minimal graph class containing a mapping of Node IDs to Nodes."""
     
+    __slots__ = ('nodes',)
+    
     def __init__(self):
         """Creates a graph with no nodes."""
         self.nodes = {}
@@ -53,12 +61,73 @@ class Graph:
         """Provides a string with info about a node on each line."""
         return '\n'.join(str(v) for v in self.nodes.values())
 
+def build_csr(g, reverse=False):
+    """Builds a Compressed Sparse Row view of a graph's adjacency.
+    
+    The CSR form packs every adjacency list into one flat, typed array
+    of destination ids, with a parallel array of edge weights and an
+    array of offsets marking where each node's neighbours start. The
+    neighbours of node u are the contiguous slice
+    indices[indptr[u]:indptr[u+1]], so the algorithm touches one
+    compact run of numbers per node instead of one Python object per
+    edge.
+    
+    :param g: The graph to compress. Node ids must be the dense
+        integers 0..n-1.
+    :param reverse: If True, build the transpose of the adjacency
+        instead: the slice for node u lists the sources of the edges
+        arriving at u, letting a search walk the graph's edges
+        backward.
+    :return: A tuple (indptr, indices, weights) where the first two are
+        typed integer arrays and the third is a typed float array.
+    """
+    if not reverse:
+        indptr = array('i', [0])
+        indices = array('i')
+        weights = array('d')
+        
+        for u in range(len(g.nodes)):
+            for e in g.nodes[u].edges:
+                indices.append(e.dest.id)
+                weights.append(e.weight)
+            indptr.append(len(indices))
+        
+        return indptr, indices, weights
+    
+    # The edges are stored grouped by source, so the transpose needs a
+    # counting sort by destination.
+    n = len(g.nodes)
+    indptr = array('i', [0] * (n + 1))
+    for u in range(n):
+        for e in g.nodes[u].edges:
+            indptr[e.dest.id + 1] += 1
+    for v in range(n):
+        indptr[v + 1] += indptr[v]
+    
+    indices = array('i', [0] * indptr[n])
+    weights = array('d', [0.0] * indptr[n])
+    slots = list(indptr[:n])
+    for u in range(n):
+        for e in g.nodes[u].edges:
+            k = slots[e.dest.id]
+            indices[k] = e.source.id
+            weights[k] = e.weight
+            slots[e.dest.id] += 1
+    
+    return indptr, indices, weights
+
 def dijkstra(g, startID, endID):
     """An implementation of Dijkstra's shortest-path algorithm.
     
     The version presented here uses a well-known optimization that uses a
     priority queue not present in Dijkstra's original version.
     
+    A node's distance may improve several times before the node is
+    finalized, with the node re-entering the queue each time. Whenever a
+    node is taken off the queue with a shorter path to offer, its
+    neighbours are re-relaxed; the first time a node itself comes off the
+    queue its distance is final, and any later appearances are ignored.
+    
     :param g: The graph that that all nodes are in.
     :param startID: The id of the node to start from.
     :param endID: The id of the node to try to get to.
@@ -67,58 +136,215 @@ def dijkstra(g, startID, endID):
         Both elements will be None if there is no path from start to end.
     """
     
-    # A mapping from a node's key to the previous node on the path from start.
-    prevs = { key: None for key in g.nodes }
-    # A mapping from a node's key to its distance from start.
-    dists = { key: None for key in g.nodes }
+    # Compress the graph's adjacency into flat CSR arrays.
+    indptr, indices, weights = build_csr(g)
+    
+    n = len(g.nodes)
+    
+    # The previous node on the path from start, indexed by node id.
+    prevs = [None] * n
+    # The distance from start, indexed by node id. Since the ids are the
+    # dense integers 0..n-1, flat lists replace dictionaries here: an
+    # index into a list is a direct offset, where a dictionary lookup
+    # hashes the key and probes for it. Initial distances are at positive
+    # infinity so that any discovered path compares as an improvement.
+    dists = [float('Infinity')] * n
+    # A flag per node marking whether its distance has been finalized.
+    finalized = bytearray(n)
     
     # Set the distance from the first node to zero.
     dists[startID] = 0
-    start = g.nodes[startID]
     
-    # Create a priority queue for the nodes.
-    nodePQ = PriorityQueue()
+    # Create a heap to serve as a priority queue for the nodes. A plain
+    # list managed through heapq avoids the locking that queue.PriorityQueue
+    # does for thread-safety, which is wasted work in this
+    # single-threaded algorithm.
+    nodePQ = []
     # Add the starting node to it with priority 0.
-    nodePQ.put((0, start.id))
+    heapq.heappush(nodePQ, (0, startID))
     
     # Process nodes from the queue until it is empty
-    while not nodePQ.empty():
+    while nodePQ:
         # Find the node to process based on the ID at the front of the queue.
-        currentNodeID = nodePQ.get()[1]
-        currentNode = g.nodes[currentNodeID]
+        d, u = heapq.heappop(nodePQ)
+        
+        # A node can be pushed onto the heap more than once if its distance
+        # improves while it is already queued. Only the first removal, with
+        # the node's final distance, is processed; later ones are stale.
+        if finalized[u]:
+            continue
+        finalized[u] = 1
         
         # If the current node is the end node, the path can be completed.
         # We don't have to process the rest of the queue in this case.
-        if currentNodeID == endID:
+        if u == endID:
             break
         
-        # Iterating over the edges in the current node...
-        for edge in currentNode.edges:
-            # ...if the edges's destination has not been visited
-            if prevs[edge.dest.id] is None:
-                # Set the destination's distance from the starting node,
-                dist = dists[currentNode.id] + edge.weight
-                dists[edge.dest.id] = dist
+        # Iterating over the current node's slice of the CSR arrays...
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            # ...if the path through the current node is shorter than the
+            # destination's best known distance
+            dist = dists[u] + weights[k]
+            if dist < dists[v]:
+                # set the destination's distance from the starting node,
+                dists[v] = dist
                 # set the destination's previous node to the current node,
-                prevs[edge.dest.id] = currentNode
+                prevs[v] = u
                 # put the destination node in the queue with its distance
                 # from the starting node as it's priority.
-                nodePQ.put((dist, edge.dest.id))
+                heapq.heappush(nodePQ, (dist, v))
     
     # If the end node is never reached, return none for path and distance.
-    if prevs[endID] == None:
+    if prevs[endID] is None:
         return None, None
     
     # Start constructing the path from the start node to the end node.
     path_back = [endID]
-    currentNode = g.nodes[endID]
+    current = endID
     # Add each node on the way back to the start node to the path.
-    while currentNode.id != startID:
-        currentNode = prevs[currentNode.id]
-        path_back.append(currentNode.id)
+    while current != startID:
+        current = prevs[current]
+        path_back.append(current)
     # Return the path backward reversed and the distance to the end node.
     return path_back[::-1], dists[endID]
 
+def dijkstra_bidirectional(g, startID, endID):
+    """A bidirectional variant of Dijkstra's shortest-path algorithm.
+    
+    Instead of growing one ball of finalized nodes around the start
+    until it swallows the end, this version grows two at once: one
+    forward from the start, and one backward from the end along the
+    graph's reversed edges. The shortest path is found roughly when the
+    two balls touch, so each search only covers about half the path's
+    length. Because the number of nodes within a distance tends to grow
+    quickly with that distance, two half-radius searches usually settle
+    far fewer nodes than one full-radius search.
+    
+    The two searches are the same lazy heap-based loop as in dijkstra.
+    The meeting is tracked in best, the length of the shortest start to
+    end path seen so far through any node both searches have reached.
+    Once neither frontier is close enough for the sum of their next
+    distances to beat best, no better path can exist and the search
+    stops. The path is then spliced together at the meeting node from
+    the forward search's previous nodes and the backward search's next
+    nodes.
+    
+    :param g: The graph that that all nodes are in.
+    :param startID: The id of the node to start from.
+    :param endID: The id of the node to try to get to.
+    :return: A tuple, where the first element is the path from start to end,
+        and the second element is the distance of this path.
+        Both elements will be None if there is no path from start to end.
+    """
+    
+    # The forward search walks the graph's edges as given; the backward
+    # search needs them transposed.
+    indptr_f, indices_f, weights_f = build_csr(g)
+    indptr_b, indices_b, weights_b = build_csr(g, reverse=True)
+    
+    infinity = float('Infinity')
+    n = len(g.nodes)
+    
+    # One set of search state per direction: distances, the neighbour
+    # the node was reached through, and finalization flags, all flat
+    # lists indexed by node id as in dijkstra. The backward search's
+    # nexts point toward the end node, mirroring how the forward
+    # search's prevs point back toward the start.
+    dists_f = [infinity] * n
+    dists_b = [infinity] * n
+    prevs_f = [None] * n
+    nexts_b = [None] * n
+    finalized_f = bytearray(n)
+    finalized_b = bytearray(n)
+    
+    dists_f[startID] = 0
+    dists_b[endID] = 0
+    
+    pq_f = [(0, startID)]
+    pq_b = [(0, endID)]
+    
+    # The length of the best complete path found so far, and the node
+    # the two searches met at on that path.
+    best = infinity
+    meet = None
+    
+    # If either queue empties, its search has reached everything it can
+    # and no new meeting is possible.
+    while pq_f and pq_b:
+        # Once the closest unprocessed node on each side together sit
+        # at or beyond the best known path, any path through nodes not
+        # yet processed would be at least as long, so the search is done.
+        if pq_f[0][0] + pq_b[0][0] >= best:
+            break
+        
+        # Advance whichever search has the nearer frontier. Keeping the
+        # two radii balanced keeps both balls small.
+        if pq_f[0][0] <= pq_b[0][0]:
+            d, u = heapq.heappop(pq_f)
+            if finalized_f[u]:
+                continue
+            finalized_f[u] = 1
+            
+            # The backward search may already know u's distance to the
+            # end; together the two distances are a complete path.
+            if d + dists_b[u] < best:
+                best = d + dists_b[u]
+                meet = u
+            
+            for k in range(indptr_f[u], indptr_f[u + 1]):
+                v = indices_f[k]
+                dist = d + weights_f[k]
+                if dist < dists_f[v]:
+                    dists_f[v] = dist
+                    prevs_f[v] = u
+                    heapq.heappush(pq_f, (dist, v))
+                    if dist + dists_b[v] < best:
+                        best = dist + dists_b[v]
+                        meet = v
+        else:
+            d, u = heapq.heappop(pq_b)
+            if finalized_b[u]:
+                continue
+            finalized_b[u] = 1
+            
+            if d + dists_f[u] < best:
+                best = d + dists_f[u]
+                meet = u
+            
+            # In the transposed arrays, the neighbour v is the source
+            # of an edge v->u, so improving v extends a path that
+            # continues through u on its way to the end.
+            for k in range(indptr_b[u], indptr_b[u + 1]):
+                v = indices_b[k]
+                dist = d + weights_b[k]
+                if dist < dists_b[v]:
+                    dists_b[v] = dist
+                    nexts_b[v] = u
+                    heapq.heappush(pq_b, (dist, v))
+                    if dist + dists_f[v] < best:
+                        best = dist + dists_f[v]
+                        meet = v
+    
+    # If the searches never met, there is no path from start to end.
+    if meet is None:
+        return None, None
+    
+    # Splice the path together at the meeting node: walk the forward
+    # search's previous nodes back to the start, reverse that, then
+    # follow the backward search's next nodes on to the end.
+    path_back = [meet]
+    current = meet
+    while current != startID:
+        current = prevs_f[current]
+        path_back.append(current)
+    path = path_back[::-1]
+    current = meet
+    while current != endID:
+        current = nexts_b[current]
+        path.append(current)
+    return path, best
+
 if __name__ == '__main__':
     from random import randrange
     
@@ -14,6 +14,8 @@ Enforcing that it is positive means that we have a correct result for all
 definitions of the GCD and programming languages.
 """
 
+import math
+
 def gcd(a, b):
     """An implementation of the Euclidean algorithm.
     
@@ -51,7 +53,23 @@ def gcd_recursive(a, b):
     """
     if b == 0:
         return abs(a)
-    return gcd(b, a % b)
+    return gcd_recursive(b, a % b)
+
+def gcd_batch(xs, ys):
+    """Computes the greatest common divisors of many pairs of integers.
+    
+    The implementations above spell the algorithm out step by step,
+    which is the point of this file, but it makes them a poor choice
+    when the GCDs of a large batch of pairs are needed. For that use
+    the work should happen in C: math.gcd applies the same Euclidean
+    idea without the cost of interpreting each loop iteration, and
+    mapping it over the batch keeps the per-pair dispatch in C as well.
+    
+    :param xs: A sequence of first integer inputs.
+    :param ys: A sequence of second integer inputs, of the same length.
+    :return: A list containing the GCD of each pair, in order.
+    """
+    return list(map(math.gcd, xs, ys))
 
 def gcd_extended(a, b):
     """A recursive implementation of the extended Euclidean algorithm.
@@ -100,6 +118,11 @@ def gcd_extended_iterative(a, b):
     method for solving for these coeffiecients.
     https://en.wikipedia.org/wiki/Euclidean_algorithm#Matrix_method
     
+    Each iteration needs both the quotient and the remainder of a and b.
+    A single divmod call produces the pair from one division, where
+    computing a // b and a % b separately would divide twice; for large
+    integers the divisions dominate the loop, so this matters.
+    
     :param a: The first integer input.
     :param b: The second integer input.
     :return: A tuple (x, y, d) where the first two terms are the Bezout
@@ -109,11 +132,11 @@ def gcd_extended_iterative(a, b):
     y0, y1 = 0, 1
     
     while b != 0:
-        q = a // b
+        q, r = divmod(a, b)
         x0, x1 = x1, x0 - (q * x1)
         y0, y1 = y1, y0 - (q * y1)
         
-        a, b = b, a % b
+        a, b = b, r
     
     if a < 0:
         return -x0, -y0, -a
@@ -7,6 +7,12 @@ It is intended as a reference for those looking to brush up on important
 algorithms.
 """
 
+from array import array
+
+# Subarrays at or below this length are insertion sorted rather than
+# recursively merge sorted.
+CUTOFF = 32
+
 def mergesort(a):
     """A mergesort driver function.
     
@@ -18,10 +24,32 @@ def mergesort(a):
     It is important that the original array be passed to the helper
     as the sorting destination.
     
+    A list of plain integers is first packed into typed arrays from the
+    array module, so the helper reads and writes machine integers
+    through the buffer protocol instead of dereferencing a Python
+    object per element. The helper works on memoryviews of the two
+    buffers rather than the array objects themselves; a memoryview's
+    index and slice operations go through the buffer protocol a little
+    more directly than array's do. The sorted values are copied back
+    into the caller's list at the end. Values that do not fit a signed
+    64-bit array, and lists of anything other than integers, are sorted
+    directly in the list instead.
+    
     :param a: The array to sort.
     """
-    a_source = a[:]
-    _mergesort_helper(a, a_source, 0, len(a))
+    try:
+        a_dest = array('q', a)
+    except (TypeError, OverflowError):
+        a_dest = None
+    
+    if a_dest is not None:
+        a_source = array('q', a_dest)
+        _mergesort_helper(
+            memoryview(a_dest), memoryview(a_source), 0, len(a_dest))
+        a[:] = a_dest.tolist()
+    else:
+        a_source = a[:]
+        _mergesort_helper(a, a_source, 0, len(a))
 
 def _mergesort_helper(dest, source, idx_start, idx_end):
     """A helper function for performing a top-down mergesort.
@@ -46,6 +74,14 @@ def _mergesort_helper(dest, source, idx_start, idx_end):
     if idx_end - idx_start < 2:
         return
     
+    # Short subarrays are handed off to insertion sort. Insertion sort
+    # makes more comparisons on average, but its simpler inner loop wins
+    # below this length, and stopping here cuts out the deepest levels
+    # of recursion and all of the smallest merges.
+    if idx_end - idx_start <= CUTOFF:
+        _insertion_sort_range(dest, source, idx_start, idx_end)
+        return
+    
     # This is the index of the end of the left part of the subarray
     # and the start of the right part of the subarray.
     idx_mid = (idx_start + idx_end) // 2
@@ -80,3 +116,27 @@ def _mergesort_helper(dest, source, idx_start, idx_end):
         dest[idx_dest] = source[idx_r]
         idx_dest += 1
         idx_r += 1
+
+def _insertion_sort_range(dest, source, idx_start, idx_end):
+    """Insertion sorts a subarray of the source into the destination.
+    
+    This is the base case used by _mergesort_helper for short
+    subarrays. To keep that function's invariant, that dest[start:end]
+    becomes a sorted permutation of source[start:end], the source
+    range is first copied over the destination range, then sorted in
+    place there.
+    
+    :param dest: The destination for the sorted elements.
+    :param source: The array containing the subarray to sort.
+    :param idx_start: The index of the beginning of the subarray to sort.
+    :param idx_end: The index of the end of the subarray to sort.
+    """
+    dest[idx_start:idx_end] = source[idx_start:idx_end]
+    
+    for i in range(idx_start + 1, idx_end):
+        j = i - 1
+        x = dest[i]
+        while j >= idx_start and x < dest[j]:
+            dest[j + 1] = dest[j]
+            j -= 1
+        dest[j + 1] = x
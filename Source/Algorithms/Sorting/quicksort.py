@@ -13,7 +13,15 @@ def quicksort(a, low, high):
     The associated partition function actually does all of the work here.
     This function has two major responsiblities:
         1) Check for edge cases.
-        2) Dispatch recursive calls.
+        2) Dispatch the sorting of both parts of each partition.
+    
+    After partitioning, only the smaller of the two unsorted parts is
+    sorted through a recursive call; the loop then continues on the
+    larger part directly. Since the recursed-into part is at most half
+    of the current range, the recursion is never more than log2(n)
+    frames deep, where naive recursion into both parts can reach n
+    frames on unbalanced partitions and overflow Python's recursion
+    limit.
     
     This function operates in-place on the input array. The argument `a` is
     expected to be a list and lists are passed by reference in Python.
@@ -24,23 +32,31 @@ def quicksort(a, low, high):
     :param low: The index to start sorting at.
     :param high: The index to stop sorting at.
     """
-    if high > low + 1:
-        idx_p = _quicksort_partition(a, low, high)
-        quicksort(a, low, idx_p)
-        quicksort(a, idx_p, high)
+    while high - low > 1:
+        idx_lt, idx_gt = _quicksort_partition(a, low, high)
+        
+        if idx_lt - low < high - idx_gt:
+            quicksort(a, low, idx_lt)
+            low = idx_gt
+        else:
+            quicksort(a, idx_gt, high)
+            high = idx_lt
 
 def _quicksort_partition(a, low, high):
     """An implementation of a partitioning function for quicksort algorithms.
     
     This function exists as a helper for :func:`quicksort` (above).
     
-    At this function's end, the input array is partitioned into two halves.
-    No element on the left side compares greater than an element on the right.
+    At this function's end, the input array is partitioned into three parts.
+    Elements that compare less than the pivot come first, then every element
+    equal to the pivot, then the elements greater than the pivot.
     
-    This particular partioning function is a minor variation on Hoare's method.
-    Rather than use one of the end elements as a pivot, it uses the element at
-    the center of the list. This results in greater efficiency when the list
-    is nearly sorted.
+    The pivot is taken from the center of the list, which results in greater
+    efficiency when the list is nearly sorted. Grouping the elements equal to
+    the pivot into their own middle part means that part is already in its
+    final position, so the recursion above only revisits the strictly-less
+    and strictly-greater parts. On inputs with many repeated values this
+    removes whole subarrays from the sort.
     
     N.B. The `high` index here is past the end of the subarray to be partioned
     this call.
@@ -48,33 +64,35 @@ def _quicksort_partition(a, low, high):
     :param a: The array to partition.
     :param low: The index to start sorting at.
     :param high: The index to stop sorting at.
-    :return: The index of the partition.
-        This is the index of the first element in the right sub-array.
-        Equivalently, it is just past the last element of the left sub-array.
+    :return: A tuple of two indexes. The first is just past the last element
+        of the less-than part, and the second is the index of the first
+        element of the greater-than part. The elements between the two are
+        all equal to the pivot.
     """
-    """The general idea here is we move two indexes from opposite sides of the
-    array towards each other iteratively. Elements that could belong on the
-    other side of the pivot are swapped as we go. When the indexes meet or pass
-    each other, then we stop and return one of them as the partition point.
+    """The general idea here is we sweep a single index across the array,
+    keeping three regions: elements less than the pivot at the front,
+    elements equal to the pivot behind the sweep, and elements greater than
+    the pivot accumulating at the back. Each examined element is swapped
+    into the region it belongs to, and the sweep ends when it reaches the
+    greater-than region.
     """
     pivot = a[(low + high) // 2]
     
-    idx_l = low
-    idx_r = high - 1
+    idx_lt = low
+    idx_cur = low
+    idx_gt = high
     
-    while True:
-        while a[idx_l] < pivot:
-            idx_l += 1
-        
-        while a[idx_r] > pivot:
-            idx_r -= 1
-        
-        if idx_r <= idx_l:
-            break
-        
-        a[idx_l], a[idx_r] = a[idx_r], a[idx_l]
+    while idx_cur < idx_gt:
+        x = a[idx_cur]
         
-        idx_l += 1
-        idx_r -= 1
+        if x < pivot:
+            a[idx_lt], a[idx_cur] = x, a[idx_lt]
+            idx_lt += 1
+            idx_cur += 1
+        elif x > pivot:
+            idx_gt -= 1
+            a[idx_cur], a[idx_gt] = a[idx_gt], x
+        else:
+            idx_cur += 1
     
-    return idx_l
+    return idx_lt, idx_gt